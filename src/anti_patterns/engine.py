@@ -144,12 +144,19 @@ class AntiPatternEngine:
                 self.active_effects.remove(effect)
 
     def _check_triggers(self) -> None:
-        for pattern in self.patterns:
-            if not pattern.enabled or pattern.remaining_cooldown > 0:
-                continue
-
-            if pattern.trigger.should_activate(self.trigger_context):
-                self._activate_pattern(pattern)
+        context = self.trigger_context
+        context.begin_check()
+        try:
+            for pattern in self.patterns:
+                if not pattern.enabled or pattern.remaining_cooldown > 0:
+                    continue
+
+                if pattern.trigger.should_activate(context):
+                    self._activate_pattern(pattern)
+                    # Effects may change setting states.
+                    context.begin_check()
+        finally:
+            context.end_check()
 
     def _activate_pattern(self, pattern: AntiPattern) -> None:
         if pattern.effect not in self.active_effects:
@@ -5,6 +5,8 @@ from typing import Any
 
 from src.core.game_state import GameState
 
+_UNSET = object()
+
 
 @dataclass
 class TriggerContext:
@@ -12,9 +14,49 @@ class TriggerContext:
     counters: dict[str, int] = field(default_factory=dict)
     events: dict[str, int] = field(default_factory=dict)
     random: Random = field(default_factory=Random)
+    _checking: bool = field(default=False, init=False, repr=False, compare=False)
+    _progress: Any = field(default=_UNSET, init=False, repr=False, compare=False)
+
+    def begin_check(self) -> None:
+        # Progress is shared by every ProgressTrigger until end_check(); the
+        # caller restarts the check whenever it may have changed settings.
+        self._checking = True
+        self._progress = _UNSET
+
+    def end_check(self) -> None:
+        self._checking = False
+        self._progress = _UNSET
+
+    def get_progress(self) -> float | None:
+        if self._progress is not _UNSET:
+            return self._progress
+
+        progress = _calculate_progress(self.game_state)
+        if self._checking:
+            self._progress = progress
+        return progress
+
+
+def _calculate_progress(game_state: GameState) -> float | None:
+    total = len(game_state.settings)
+    if total == 0:
+        return None
+
+    enabled = sum(
+        1
+        for s in game_state.settings.values()
+        if s.state.value in ["enabled", "locked"]
+    )
+    return (enabled / total) * 100
 
 
 class Trigger(ABC):
+    # Relative evaluation cost; composites check cheaper children first.
+    cost = 1
+    # Stateless triggers have no side effects when checked, so composites
+    # may reorder them. Stateful ones keep the position the caller gave.
+    stateless = False
+
     def __init__(self, trigger_id: str):
         self.id = trigger_id
         self.activated_count = 0
@@ -28,6 +70,8 @@ class Trigger(ABC):
 
 
 class CounterTrigger(Trigger):
+    stateless = True
+
     def __init__(self, trigger_id: str, counter_name: str, threshold: int):
         super().__init__(trigger_id)
         self.counter_name = counter_name
@@ -41,13 +85,15 @@ class CounterTrigger(Trigger):
 class RandomTrigger(Trigger):
     def __init__(self, trigger_id: str, probability: float):
         super().__init__(trigger_id)
-        self.probability = max(0.0, min(1.0, probability))
+        self.probability = min(1.0, max(0.0, float(probability)))
 
     def should_activate(self, context: TriggerContext) -> bool:
         return context.random.random() < self.probability
 
 
 class EventTrigger(Trigger):
+    stateless = True
+
     def __init__(self, trigger_id: str, event_name: str):
         super().__init__(trigger_id)
         self.event_name = event_name
@@ -59,8 +105,10 @@ class EventTrigger(Trigger):
 class CompositeTrigger(Trigger):
     def __init__(self, trigger_id: str, triggers: list[Trigger], require_all: bool):
         super().__init__(trigger_id)
-        self.triggers = triggers
+        self.triggers = _order_by_cost(triggers)
         self.require_all = require_all
+        self.cost = sum(t.cost for t in self.triggers)
+        self.stateless = all(t.stateless for t in self.triggers)
 
     def should_activate(self, context: TriggerContext) -> bool:
         if self.require_all:
@@ -68,24 +116,36 @@ class CompositeTrigger(Trigger):
         return any(t.should_activate(context) for t in self.triggers)
 
 
+def _order_by_cost(triggers: list[Trigger]) -> list[Trigger]:
+    # Sort each run of stateless triggers by cost. Stateful triggers act as
+    # barriers, so short-circuiting skips exactly the same stateful checks.
+    ordered: list[Trigger] = []
+    run: list[Trigger] = []
+    for trigger in triggers:
+        if trigger.stateless:
+            run.append(trigger)
+            continue
+        ordered.extend(sorted(run, key=lambda t: t.cost))
+        run = []
+        ordered.append(trigger)
+    ordered.extend(sorted(run, key=lambda t: t.cost))
+    return ordered
+
+
 class ProgressTrigger(Trigger):
+    cost = 5
+    stateless = True
+
     def __init__(self, trigger_id: str, min_progress: float, max_progress: float):
         super().__init__(trigger_id)
         self.min_progress = min_progress
         self.max_progress = max_progress
 
     def should_activate(self, context: TriggerContext) -> bool:
-        total = len(context.game_state.settings)
-        if total == 0:
+        progress = context.get_progress()
+        if progress is None:
             return False
 
-        enabled = sum(
-            1
-            for s in context.game_state.settings.values()
-            if s.state.value in ["enabled", "locked"]
-        )
-        progress = (enabled / total) * 100
-
         return self.min_progress <= progress <= self.max_progress
 
 
@@ -108,6 +168,7 @@ class OnceTrigger(Trigger):
     def __init__(self, trigger_id: str, base_trigger: Trigger):
         super().__init__(trigger_id)
         self.base_trigger = base_trigger
+        self.cost = base_trigger.cost
         self.has_fired = False
 
     def should_activate(self, context: TriggerContext) -> bool:
@@ -120,26 +181,22 @@ class OnceTrigger(Trigger):
 
 
 class TriggerFactory:
+    TRIGGER_MAP: dict[str, tuple[type[Trigger], tuple[str, ...]]] = {
+        "counter": (CounterTrigger, ("counter", "threshold")),
+        "random": (RandomTrigger, ("probability",)),
+        "event": (EventTrigger, ("event",)),
+        "progress": (ProgressTrigger, ("min_progress", "max_progress")),
+        "interval": (IntervalTrigger, ("counter", "interval")),
+    }
+
     @staticmethod
     def from_config(config_dict: dict[str, Any]) -> Trigger:
         trigger_type = config_dict["type"]
         trigger_id = config_dict["id"]
 
-        if trigger_type == "counter":
-            return CounterTrigger(
-                trigger_id, config_dict["counter"], config_dict["threshold"]
-            )
-        elif trigger_type == "random":
-            return RandomTrigger(trigger_id, config_dict["probability"])
-        elif trigger_type == "event":
-            return EventTrigger(trigger_id, config_dict["event"])
-        elif trigger_type == "progress":
-            return ProgressTrigger(
-                trigger_id, config_dict["min_progress"], config_dict["max_progress"]
-            )
-        elif trigger_type == "interval":
-            return IntervalTrigger(
-                trigger_id, config_dict["counter"], config_dict["interval"]
-            )
-        else:
+        entry = TriggerFactory.TRIGGER_MAP.get(trigger_type)
+        if entry is None:
             raise ValueError(f"Unknown trigger type: {trigger_type}")
+
+        trigger_class, arg_keys = entry
+        return trigger_class(trigger_id, *(config_dict[key] for key in arg_keys))
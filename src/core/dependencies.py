@@ -1,5 +1,6 @@
 """Dependency resolution system for settings."""
 
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Protocol
 
 from src.core.enums import SettingState
@@ -102,6 +103,16 @@ class DependencyResolver:
             self.dependencies[setting_id] = []
         self.dependencies[setting_id].append(dependency)
 
+    def add_dependencies(self, pairs: Iterable[tuple[str, Dependency]]) -> None:
+        """Add several dependencies in one call.
+
+        Args:
+            pairs: (setting_id, dependency) pairs, added in order
+        """
+        dependencies = self.dependencies
+        for setting_id, dependency in pairs:
+            dependencies.setdefault(setting_id, []).append(dependency)
+
     def can_enable(self, setting_id: str, game_state: "GameState") -> bool:
         """Check if a setting can be enabled.
 
@@ -1,5 +1,6 @@
 """Menu node structure for Ready to Start game system."""
 
+import sys
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -36,6 +37,10 @@ class MenuNode:
     completion_state: CompletionState = CompletionState.INCOMPLETE
     level_id: str | None = None
 
+    def __post_init__(self):
+        """Intern the ID; it is hashed and compared on every menu lookup."""
+        self.id = sys.intern(self.id)
+
     def add_setting(self, setting: Setting) -> None:
         """Add a setting to this menu node."""
         self.settings.append(setting)
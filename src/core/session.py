@@ -1,11 +1,13 @@
 import json
 import time
+from collections import deque
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 
 from src.core.game_state import GameState
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionMetrics:
     start_time: float = field(default_factory=time.time)
     settings_viewed: int = 0
@@ -29,10 +31,20 @@ class SessionMetrics:
 
 
 class SessionManager:
+    MAX_EVENTS = 100
+
+    _METRIC_FIELDS = {
+        "setting_viewed": "settings_viewed",
+        "setting_modified": "settings_modified",
+        "menu_visited": "menus_visited",
+        "click": "clicks",
+        "hover": "hovers",
+    }
+
     def __init__(self, game_state: GameState):
         self.state = game_state
         self.metrics = SessionMetrics()
-        self.events: list[dict] = []
+        self.events: deque[dict] = deque(maxlen=self.MAX_EVENTS)
 
     def record_event(self, event_type: str, data: dict | None = None) -> None:
         event = {
@@ -43,6 +55,14 @@ class SessionManager:
         self.events.append(event)
         self._update_metrics(event_type)
 
+    def record_events(self, events: Iterable[tuple[str, dict | None]]) -> None:
+        timestamp = time.time()
+        for event_type, data in events:
+            self.events.append(
+                {"type": event_type, "timestamp": timestamp, "data": data or {}}
+            )
+            self._update_metrics(event_type)
+
     def update_progress(self, progress: float) -> None:
         self.metrics.progress_percentage = progress
 
@@ -63,28 +83,14 @@ class SessionManager:
         return {
             "metrics": self.metrics.to_dict(),
             "efficiency": self.get_efficiency_score(),
-            "events": self.events[-100:],
+            "events": list(self.events),
         }
 
     def save_to_file(self, filepath: str) -> None:
         with open(filepath, "w") as f:
-            json.dump(self.serialize(), f, indent=2)
+            f.write(json.dumps(self.serialize(), separators=(",", ":")))
 
     def _update_metrics(self, event_type: str) -> None:
-        metric_map = {
-            "setting_viewed": lambda: setattr(
-                self.metrics, "settings_viewed", self.metrics.settings_viewed + 1
-            ),
-            "setting_modified": lambda: setattr(
-                self.metrics, "settings_modified", self.metrics.settings_modified + 1
-            ),
-            "menu_visited": lambda: setattr(
-                self.metrics, "menus_visited", self.metrics.menus_visited + 1
-            ),
-            "click": lambda: setattr(self.metrics, "clicks", self.metrics.clicks + 1),
-            "hover": lambda: setattr(self.metrics, "hovers", self.metrics.hovers + 1),
-        }
-
-        handler = metric_map.get(event_type)
-        if handler:
-            handler()
+        field_name = self._METRIC_FIELDS.get(event_type)
+        if field_name:
+            setattr(self.metrics, field_name, getattr(self.metrics, field_name) + 1)
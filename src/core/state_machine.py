@@ -11,14 +11,16 @@ class SettingStateMachine:
     methods to validate and perform transitions.
     """
 
-    TRANSITIONS = {
-        SettingState.DISABLED: [SettingState.ENABLED, SettingState.HIDDEN],
-        SettingState.ENABLED: [SettingState.DISABLED, SettingState.LOCKED],
-        SettingState.LOCKED: [SettingState.ENABLED],
-        SettingState.HIDDEN: [SettingState.DISABLED, SettingState.ENABLED],
-        SettingState.BLINKING: [SettingState.ENABLED, SettingState.DISABLED],
+    TRANSITIONS: dict[SettingState, frozenset[SettingState]] = {
+        SettingState.DISABLED: frozenset({SettingState.ENABLED, SettingState.HIDDEN}),
+        SettingState.ENABLED: frozenset({SettingState.DISABLED, SettingState.LOCKED}),
+        SettingState.LOCKED: frozenset({SettingState.ENABLED}),
+        SettingState.HIDDEN: frozenset({SettingState.DISABLED, SettingState.ENABLED}),
+        SettingState.BLINKING: frozenset({SettingState.ENABLED, SettingState.DISABLED}),
     }
 
+    _NO_TRANSITIONS: frozenset[SettingState] = frozenset()
+
     @staticmethod
     def can_transition(from_state: SettingState, to_state: SettingState) -> bool:
         """Check if a transition is valid.
@@ -30,7 +32,9 @@ class SettingStateMachine:
         Returns:
             True if transition is allowed
         """
-        allowed_transitions = SettingStateMachine.TRANSITIONS.get(from_state, [])
+        allowed_transitions = SettingStateMachine.TRANSITIONS.get(
+            from_state, SettingStateMachine._NO_TRANSITIONS
+        )
         return to_state in allowed_transitions
 
     @staticmethod
@@ -50,13 +54,15 @@ class SettingStateMachine:
         return False
 
     @staticmethod
-    def get_allowed_transitions(state: SettingState) -> list[SettingState]:
+    def get_allowed_transitions(state: SettingState) -> frozenset[SettingState]:
         """Get all allowed transitions from a given state.
 
         Args:
             state: Current state
 
         Returns:
-            List of allowed target states
+            Set of allowed target states
         """
-        return SettingStateMachine.TRANSITIONS.get(state, [])
+        return SettingStateMachine.TRANSITIONS.get(
+            state, SettingStateMachine._NO_TRANSITIONS
+        )
@@ -1,12 +1,14 @@
 """Core data types for Ready to Start game system."""
 
+import math
+import sys
 from dataclasses import dataclass
 from typing import Any
 
 from src.core.enums import SettingState, SettingType
 
 
-@dataclass
+@dataclass(slots=True)
 class Setting:
     """A single setting in the game menu system.
 
@@ -35,8 +37,12 @@ class Setting:
     level_id: str | None = None
 
     def __post_init__(self):
-        """Validate setting attributes."""
+        """Intern the ID and validate setting attributes."""
+        self.id = sys.intern(self.id)
         if self.type in (SettingType.INTEGER, SettingType.FLOAT):
-            if self.min_value is not None and self.max_value is not None:
-                if self.min_value > self.max_value:
-                    raise ValueError("min_value cannot be greater than max_value")
+            # A missing bound is unbounded on that side, so one comparison
+            # covers every combination.
+            low = -math.inf if self.min_value is None else self.min_value
+            high = math.inf if self.max_value is None else self.max_value
+            if low > high:
+                raise ValueError("min_value cannot be greater than max_value")
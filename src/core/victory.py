@@ -2,6 +2,7 @@ import configparser
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
+from typing import Any
 
 from src.core.enums import CompletionState
 from src.core.game_state import GameState
@@ -28,15 +29,30 @@ class VictoryDetector:
         self.progress = progress_calc
         self.conditions: list[VictoryCondition] = []
         self.current_layer = 0
+        self._memo: dict[Any, Any] | None = None
 
     def add_condition(self, condition: VictoryCondition) -> None:
         self.conditions.append(condition)
 
     def check_victory(self) -> VictoryCondition | None:
-        for condition in self.conditions:
-            if all(req(self.state) for req in condition.requirements):
-                return condition
-        return None
+        # The state cannot change while conditions are checked, so progress
+        # queries shared between requirements are computed once per check.
+        self._memo = {}
+        try:
+            for condition in self.conditions:
+                if all(req(self.state) for req in condition.requirements):
+                    return condition
+            return None
+        finally:
+            self._memo = None
+
+    def _memoized(self, key: Any, compute: Callable[[], Any]) -> Any:
+        memo = self._memo
+        if memo is None:
+            return compute()
+        if key not in memo:
+            memo[key] = compute()
+        return memo[key]
 
     def load_from_config(self, config_path: str) -> None:
         parser = configparser.ConfigParser()
@@ -55,7 +71,9 @@ class VictoryDetector:
 
     def _parse_requirement(self, req_str: str) -> Callable[[GameState], bool]:
         if req_str == "critical_path_complete":
-            return lambda state: self.progress.is_victory_condition_met()
+            return lambda state: self._memoized(
+                "critical_path", self.progress.is_victory_condition_met
+            )
         elif req_str.startswith("progress"):
             return self._parse_progress_requirement(req_str)
         elif req_str.startswith("menu:"):
@@ -67,7 +85,12 @@ class VictoryDetector:
     def _parse_progress_requirement(self, req_str: str) -> Callable[[GameState], bool]:
         parts = req_str.split()
         threshold = float(parts[2])
-        return lambda state: self.progress.calculate_overall_progress() >= threshold
+        return (
+            lambda state: self._memoized(
+                "progress", self.progress.calculate_overall_progress
+            )
+            >= threshold
+        )
 
     def _parse_menu_requirement(self, req_str: str) -> Callable[[GameState], bool]:
         parts = req_str.split()
@@ -75,7 +98,10 @@ class VictoryDetector:
         required_state = CompletionState(parts[2])
 
         def menu_check(state: GameState) -> bool:
-            completion = self.progress.calculate_menu_completion(menu_id)
+            completion = self._memoized(
+                ("menu", menu_id),
+                lambda: self.progress.calculate_menu_completion(menu_id),
+            )
             return completion == required_state
 
         return menu_check
@@ -7,23 +7,30 @@ class GraphAnalyzer:
         start_nodes = GraphAnalyzer.get_start_nodes(graph)
         end_nodes = GraphAnalyzer.get_end_nodes(graph)
 
-        longest_path = []
+        # One BFS per start node gives every end's distance; only the winning
+        # pair needs an actual path, so we avoid a has_path + shortest_path
+        # traversal for every (start, end) combination.
+        best_pair = None
+        best_length = -1
         for start in start_nodes:
+            distances = nx.single_source_shortest_path_length(graph, start)
             for end in end_nodes:
-                if nx.has_path(graph, start, end):
-                    path = nx.shortest_path(graph, start, end)
-                    if len(path) > len(longest_path):
-                        longest_path = path
+                length = distances.get(end)
+                if length is not None and length > best_length:
+                    best_pair = (start, end)
+                    best_length = length
 
-        return longest_path
+        if best_pair is None:
+            return []
+        return nx.shortest_path(graph, *best_pair)
 
     @staticmethod
     def get_start_nodes(graph: nx.DiGraph) -> list[str]:
-        return [n for n in graph.nodes() if graph.in_degree(n) == 0]
+        return [n for n, degree in graph.in_degree() if degree == 0]
 
     @staticmethod
     def get_end_nodes(graph: nx.DiGraph) -> list[str]:
-        return [n for n in graph.nodes() if graph.out_degree(n) == 0]
+        return [n for n, degree in graph.out_degree() if degree == 0]
 
     @staticmethod
     def get_reachable_from(graph: nx.DiGraph, start_node: str) -> set[str]:
@@ -180,12 +180,16 @@ class GenerationPipeline:
                 continue
             order = list(menu.settings)
             random.shuffle(order)
-            for i in range(1, len(order)):
-                dep = SimpleDependency(
-                    setting_id=order[i - 1].id,
-                    required_state=SettingState.ENABLED,
+            game_state.resolver.add_dependencies(
+                (
+                    order[i].id,
+                    SimpleDependency(
+                        setting_id=order[i - 1].id,
+                        required_state=SettingState.ENABLED,
+                    ),
                 )
-                game_state.resolver.add_dependency(order[i].id, dep)
+                for i in range(1, len(order))
+            )
 
     def _generate_topology(self):
         wfc = WFCGenerator(self.wfc_rules, self.config)
@@ -233,9 +237,11 @@ class GenerationPipeline:
         dep_gen = DependencyGenerator(graph, self.config, game_state.menus)
         dependencies = dep_gen.generate_dependencies()
 
-        for setting_id, deps in dependencies.items():
-            for dep in deps:
-                game_state.resolver.add_dependency(setting_id, dep)
+        game_state.resolver.add_dependencies(
+            (setting_id, dep)
+            for setting_id, deps in dependencies.items()
+            for dep in deps
+        )
 
     def _set_starting_menu(self, graph, game_state: GameState) -> None:
         start_nodes = GraphAnalyzer.get_start_nodes(graph)
@@ -1,3 +1,5 @@
+import sys
+
 import networkx as nx
 
 from src.core.config_loader import GenerationConfig
@@ -12,10 +14,15 @@ class TopologyConverter:
         self.config = config
         self.graph = nx.DiGraph()
         self.critical_path: list[str] = []
+        self._graph_version = 0
+        self._critical_path_graph: nx.DiGraph | None = None
+        self._critical_path_version = -1
 
     def grid_to_graph(self, grid: WFCGrid) -> nx.DiGraph:
-        self._add_nodes(grid)
-        self._add_edges(grid)
+        node_ids = self._collect_node_ids(grid)
+        self._add_nodes(grid, node_ids)
+        self._add_edges(grid, node_ids)
+        self._graph_version += 1
         return self.graph
 
     def validate_graph(self) -> bool:
@@ -38,35 +45,44 @@ class TopologyConverter:
             self._prune_using_components()
 
     def get_critical_path(self) -> list[str]:
-        if not self.critical_path:
+        if not self._critical_path_is_current():
             self.critical_path = self._find_critical_path()
+            self._critical_path_graph = self.graph
+            self._critical_path_version = self._graph_version
         return self.critical_path
 
-    def _add_nodes(self, grid: WFCGrid) -> None:
-        for pos, cell in grid.cells.items():
-            if cell.collapsed:
-                node_id = self._create_node_id(cell.state, pos)
-                self.graph.add_node(node_id, category=cell.state, position=pos)
-
-    def _add_edges(self, grid: WFCGrid) -> None:
-        for pos, cell in grid.cells.items():
-            if not cell.collapsed:
-                continue
-
-            node_id = self._create_node_id(cell.state, pos)
-
-            for neighbor in grid.get_neighbors(pos):
-                if neighbor.collapsed:
-                    neighbor_id = self._create_node_id(
-                        neighbor.state, neighbor.position
-                    )
-                    self.graph.add_edge(node_id, neighbor_id)
+    def _critical_path_is_current(self) -> bool:
+        return (
+            self._critical_path_graph is self.graph
+            and self._critical_path_version == self._graph_version
+        )
+
+    def _collect_node_ids(self, grid: WFCGrid) -> dict[tuple[int, int], str]:
+        return {
+            pos: self._create_node_id(cell.state, pos)
+            for pos, cell in grid.cells.items()
+            if cell.collapsed
+        }
+
+    def _add_nodes(self, grid: WFCGrid, node_ids: dict[tuple[int, int], str]) -> None:
+        self.graph.add_nodes_from(
+            (node_id, {"category": grid.cells[pos].state, "position": pos})
+            for pos, node_id in node_ids.items()
+        )
+
+    def _add_edges(self, grid: WFCGrid, node_ids: dict[tuple[int, int], str]) -> None:
+        self.graph.add_edges_from(
+            (node_id, node_ids[neighbor.position])
+            for pos, node_id in node_ids.items()
+            for neighbor in grid.get_neighbors(pos)
+            if neighbor.collapsed
+        )
 
     def _create_node_id(self, state: str | None, pos: tuple[int, int]) -> str:
-        return f"{state}_{pos[0]}_{pos[1]}"
+        return sys.intern(f"{state}_{pos[0]}_{pos[1]}")
 
     def _has_valid_critical_path(self) -> bool:
-        path = self._find_critical_path()
+        path = self.get_critical_path()
         return len(path) >= self.config.min_path_length
 
     def _find_critical_path(self) -> list[str]:
@@ -88,7 +104,9 @@ class TopologyConverter:
                 max_reachable = reachable
 
         unreachable = set(self.graph.nodes()) - max_reachable
-        self.graph.remove_nodes_from(unreachable)
+        if unreachable:
+            self.graph.remove_nodes_from(unreachable)
+            self._graph_version += 1
 
     def _prune_using_components(self) -> None:
         components = list(nx.weakly_connected_components(self.graph))
@@ -96,3 +114,4 @@ class TopologyConverter:
             largest = max(components, key=len)
             to_remove = set(self.graph.nodes()) - largest
             self.graph.remove_nodes_from(to_remove)
+            self._graph_version += 1
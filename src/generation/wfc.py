@@ -1,4 +1,5 @@
 import random
+from collections import deque
 from dataclasses import dataclass, field
 
 from src.core.config_loader import GenerationConfig
@@ -8,6 +9,9 @@ class ContradictionError(Exception):
     pass
 
 
+NEIGHBOR_OFFSETS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+
 @dataclass
 class WFCCell:
     position: tuple[int, int]
@@ -23,7 +27,7 @@ class WFCCell:
         self.entropy = 0
         return self.state
 
-    def constrain(self, allowed: set[str]) -> None:
+    def constrain(self, allowed: set[str] | frozenset[str]) -> None:
         self.possible_states &= allowed
         self.entropy = len(self.possible_states)
 
@@ -33,30 +37,55 @@ class WFCGrid:
     width: int
     height: int
     cells: dict[tuple[int, int], WFCCell] = field(default_factory=dict)
+    _neighbors: dict[tuple[int, int], tuple[tuple[int, int], ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         for x in range(self.width):
             for y in range(self.height):
                 self.cells[(x, y)] = WFCCell(position=(x, y), possible_states=set())
 
+        # The grid shape never changes, so neighbor positions are found once;
+        # cells are still looked up live so replaced cells are picked up.
+        for pos in self.cells:
+            self._neighbors[pos] = self._neighbor_positions(pos)
+
     def get_neighbors(self, pos: tuple[int, int]) -> list[WFCCell]:
+        positions = self._neighbors.get(pos)
+        if positions is None:
+            positions = self._neighbor_positions(pos)
+        cells = self.cells
+        return [cells[p] for p in positions if p in cells]
+
+    def _neighbor_positions(self, pos: tuple[int, int]) -> tuple[tuple[int, int], ...]:
         x, y = pos
-        neighbors = []
-        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-            nx, ny = x + dx, y + dy
-            if (nx, ny) in self.cells:
-                neighbors.append(self.cells[(nx, ny)])
-        return neighbors
+        return tuple(
+            (x + dx, y + dy)
+            for dx, dy in NEIGHBOR_OFFSETS
+            if (x + dx, y + dy) in self.cells
+        )
 
     def get_lowest_entropy_cell(self) -> WFCCell | None:
-        uncollapsed = [
-            cell
-            for cell in self.cells.values()
-            if not cell.collapsed and cell.entropy > 0
-        ]
-        if not uncollapsed:
-            return None
-        return min(uncollapsed, key=lambda c: c.entropy)
+        return self.scan()[0]
+
+    def scan(self) -> tuple[WFCCell | None, bool, bool]:
+        # Lowest-entropy cell, is_complete() and has_contradiction() in one
+        # pass, since the collapse loop needs all three every iteration.
+        lowest = None
+        complete = True
+        contradiction = False
+        for cell in self.cells.values():
+            if cell.collapsed:
+                continue
+            complete = False
+            if cell.entropy <= 0:
+                if cell.entropy == 0:
+                    contradiction = True
+                continue
+            if lowest is None or cell.entropy < lowest.entropy:
+                lowest = cell
+        return lowest, complete, contradiction
 
     def is_complete(self) -> bool:
         return all(cell.collapsed for cell in self.cells.values())
@@ -70,6 +99,7 @@ class WFCGrid:
 DEFAULT_GRID_SIZE = 5
 MAX_RETRIES = 3
 ITERATION_SAFETY_MULTIPLIER = 2
+_NO_CONNECTIONS: frozenset[str] = frozenset()
 
 
 class WFCGenerator:
@@ -81,6 +111,10 @@ class WFCGenerator:
         grid_height: int = DEFAULT_GRID_SIZE,
     ):
         self.rules = rules
+        self.connections = {
+            category: frozenset(info.get("connections", []))
+            for category, info in rules.items()
+        }
         self.config = config
         self.grid = WFCGrid(width=grid_width, height=grid_height)
         self.grid_width = grid_width
@@ -93,11 +127,11 @@ class WFCGenerator:
             cell.entropy = len(all_categories)
 
     def propagate(self, cell: WFCCell) -> None:
-        queue = [cell]
+        queue = deque([cell])
         visited = set()
 
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             if current.position in visited:
                 continue
             visited.add(current.position)
@@ -105,9 +139,7 @@ class WFCGenerator:
             if not current.collapsed:
                 continue
 
-            valid_neighbors = set(
-                self.rules.get(current.state, {}).get("connections", [])
-            )
+            valid_neighbors = self.connections.get(current.state, _NO_CONNECTIONS)
 
             for neighbor in self.grid.get_neighbors(current.position):
                 if neighbor.collapsed:
@@ -128,12 +160,12 @@ class WFCGenerator:
         max_iterations = self._calculate_max_iterations()
         iterations = 0
 
-        while not self.grid.is_complete() and iterations < max_iterations:
-            cell = self.grid.get_lowest_entropy_cell()
-            if not cell:
+        while iterations < max_iterations:
+            cell, complete, contradiction = self.grid.scan()
+            if complete or not cell:
                 break
 
-            if self.grid.has_contradiction():
+            if contradiction:
                 raise ContradictionError("WFC reached contradiction")
 
             cell.collapse()
@@ -1,11 +1,11 @@
 import json
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from time import time
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class GameStatistics:
     total_play_time: float = 0.0
     time_per_layer: dict[str, float] = field(default_factory=dict)
@@ -36,6 +36,11 @@ class GameStatistics:
     secrets_found: list[str] = field(default_factory=list)
     quit_attempts: int = 0
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "GameStatistics":
+        names = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in names})
+
     def get_total_time(self) -> float:
         return self.total_play_time + (time() - self.session_start_time)
 
@@ -135,10 +140,11 @@ class StatisticsTracker:
         self.stats.best_efficiency = max(self.stats.best_efficiency, efficiency)
         self.stats.worst_efficiency = min(self.stats.worst_efficiency, efficiency)
 
-        total_layers = len(self.stats.time_per_layer)
-        if total_layers > 0:
-            current_total = self.stats.average_efficiency * (total_layers - 1)
-            self.stats.average_efficiency = (current_total + efficiency) / total_layers
+        completed = self.stats.layers_completed
+        if completed > 0:
+            self.stats.average_efficiency += (
+                efficiency - self.stats.average_efficiency
+            ) / completed
 
     def record_secret_found(self, secret_id: str):
         if secret_id not in self.stats.secrets_found:
@@ -150,14 +156,9 @@ class StatisticsTracker:
 
     def save_to_file(self, filepath: str | Path):
         with open(filepath, "w") as f:
-            json.dump(self.stats.serialize(), f, indent=2)
+            f.write(json.dumps(self.stats.serialize(), separators=(",", ":")))
 
     def load_from_file(self, filepath: str | Path):
-        with open(filepath) as f:
-            data = json.load(f)
-
-        for key, value in data.items():
-            if hasattr(self.stats, key):
-                setattr(self.stats, key, value)
-
-        self.stats.session_start_time = time()
+        data = json.loads(Path(filepath).read_text())
+        data.pop("session_start_time", None)
+        self.stats = GameStatistics.from_dict(data)
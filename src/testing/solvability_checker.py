@@ -1,3 +1,4 @@
+from collections import deque
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -22,9 +23,19 @@ class SolvabilityChecker:
     def __init__(self, game_state: "GameState"):
         self.game_state = game_state
         self.issues: list[SolvabilityIssue] = []
+        self.issue_types: set[str] = set()
+        self._dependency_graph: nx.DiGraph | None = None
+        self._unlockable: set[str] | None = None
+
+    def invalidate(self) -> None:
+        # Derived structures are reused across validate() calls; drop them
+        # after mutating the game state this checker was built for.
+        self._dependency_graph = None
+        self._unlockable = None
 
     def validate(self) -> bool:
         self.issues.clear()
+        self.issue_types.clear()
 
         self._check_circular_dependencies()
         self._check_impossible_dependencies()
@@ -34,8 +45,15 @@ class SolvabilityChecker:
 
         return len(self.issues) == 0
 
+    def has_issue(self, issue_type: str) -> bool:
+        return issue_type in self.issue_types
+
+    def _add_issue(self, issue: SolvabilityIssue) -> None:
+        self.issues.append(issue)
+        self.issue_types.add(issue.type)
+
     def _check_circular_dependencies(self) -> None:
-        graph = self._build_dependency_graph()
+        graph = self._get_dependency_graph()
 
         # Find strongly connected components (groups of nodes with cycles)
         # Report one issue per component instead of every cycle path
@@ -51,7 +69,7 @@ class SolvabilityChecker:
                     # Get one representative cycle from this component
                     cycles = nx.simple_cycles(subgraph)
                     example_cycle = next(cycles, component_list)
-                    self.issues.append(
+                    self._add_issue(
                         SolvabilityIssue(
                             type="circular_dependency",
                             description=f"Circular dependency group ({len(component)} settings): {' -> '.join(list(example_cycle) + [list(example_cycle)[0]])}",
@@ -61,7 +79,7 @@ class SolvabilityChecker:
                     )
                 except (StopIteration, nx.NetworkXNoCycle):
                     # Fallback if we can't find a cycle (shouldn't happen)
-                    self.issues.append(
+                    self._add_issue(
                         SolvabilityIssue(
                             type="circular_dependency",
                             description=f"Circular dependency group detected with {len(component)} settings",
@@ -80,7 +98,7 @@ class SolvabilityChecker:
                 if isinstance(dep, SimpleDependency):
                     target = self.game_state.get_setting(dep.setting_id)
                     if not target:
-                        self.issues.append(
+                        self._add_issue(
                             SolvabilityIssue(
                                 type="missing_dependency",
                                 description=f"Setting '{setting.label}' depends on non-existent setting '{dep.setting_id}'",
@@ -99,7 +117,7 @@ class SolvabilityChecker:
                         if not setting_b:
                             missing.append(dep.setting_b)
 
-                        self.issues.append(
+                        self._add_issue(
                             SolvabilityIssue(
                                 type="missing_dependency",
                                 description=f"Value dependency references non-existent settings: {missing}",
@@ -112,15 +130,9 @@ class SolvabilityChecker:
         if not self.game_state.menus:
             return
 
-        graph = nx.DiGraph()
-        for menu in self.game_state.menus.values():
-            graph.add_node(menu.id)
-            for connection in menu.connections:
-                graph.add_edge(menu.id, connection)
-
         start_menu = self.game_state.current_menu
         if not start_menu:
-            self.issues.append(
+            self._add_issue(
                 SolvabilityIssue(
                     type="no_start_menu",
                     description="No starting menu defined",
@@ -130,12 +142,15 @@ class SolvabilityChecker:
             )
             return
 
-        reachable = nx.descendants(graph, start_menu)
-        reachable.add(start_menu)
+        reachable = self._reachable_menus(start_menu)
 
-        unreachable = set(graph.nodes()) - reachable
+        all_menus = set(self.game_state.menus)
+        for menu in self.game_state.menus.values():
+            all_menus.update(menu.connections)
+
+        unreachable = all_menus - reachable
         if unreachable:
-            self.issues.append(
+            self._add_issue(
                 SolvabilityIssue(
                     type="unreachable_menus",
                     description=f"Menus unreachable from start: {sorted(unreachable)}",
@@ -144,8 +159,24 @@ class SolvabilityChecker:
                 )
             )
 
+    def _reachable_menus(self, start_menu: str) -> set[str]:
+        menus = self.game_state.menus
+        reachable = {start_menu}
+        queue = deque([start_menu])
+
+        while queue:
+            menu = menus.get(queue.popleft())
+            if not menu:
+                continue
+            for connection in menu.connections:
+                if connection not in reachable:
+                    reachable.add(connection)
+                    queue.append(connection)
+
+        return reachable
+
     def _check_unlockable_settings(self) -> None:
-        unlockable = self._simulate_unlocking()
+        unlockable = self._get_unlockable()
 
         all_settings = set(self.game_state.settings.keys())
         locked_forever = all_settings - unlockable
@@ -154,7 +185,7 @@ class SolvabilityChecker:
             for setting_id in locked_forever:
                 setting = self.game_state.get_setting(setting_id)
                 if setting and setting.state == SettingState.LOCKED:
-                    self.issues.append(
+                    self._add_issue(
                         SolvabilityIssue(
                             type="unlockable_setting",
                             description=f"Setting '{setting.label}' can never be unlocked",
@@ -164,11 +195,11 @@ class SolvabilityChecker:
                     )
 
     def _check_victory_reachability(self) -> None:
-        unlockable = self._simulate_unlocking()
+        unlockable = self._get_unlockable()
         total_settings = len(self.game_state.settings)
 
         if len(unlockable) < total_settings * 0.5:
-            self.issues.append(
+            self._add_issue(
                 SolvabilityIssue(
                     type="low_completion_rate",
                     description=f"Only {len(unlockable)}/{total_settings} settings can be unlocked",
@@ -177,6 +208,16 @@ class SolvabilityChecker:
                 )
             )
 
+    def _get_dependency_graph(self) -> nx.DiGraph:
+        if self._dependency_graph is None:
+            self._dependency_graph = self._build_dependency_graph()
+        return self._dependency_graph
+
+    def _get_unlockable(self) -> set[str]:
+        if self._unlockable is None:
+            self._unlockable = self._simulate_unlocking()
+        return self._unlockable
+
     def _build_dependency_graph(self) -> nx.DiGraph:
         graph = nx.DiGraph()
 
@@ -194,43 +235,57 @@ class SolvabilityChecker:
         return graph
 
     def _simulate_unlocking(self) -> set[str]:
+        # Worklist propagation: each setting tracks the prerequisites still
+        # missing and unlocks once that set empties. Every dependency edge is
+        # visited once, instead of rescanning all settings until a pass makes
+        # no progress.
         unlocked = set()
+        pending: dict[str, set[str]] = {}
+        dependents: dict[str, list[str]] = {}
 
         for setting_id, setting in self.game_state.settings.items():
             if setting.state == SettingState.ENABLED:
                 unlocked.add(setting_id)
+                continue
 
-        changed = True
-        max_iterations = len(self.game_state.settings) * 2
-        iteration = 0
+            prerequisites = self._unlock_prerequisites(setting_id)
+            pending[setting_id] = prerequisites
+            for prerequisite in prerequisites:
+                dependents.setdefault(prerequisite, []).append(setting_id)
 
-        while changed and iteration < max_iterations:
-            changed = False
-            iteration += 1
+        queue = list(unlocked)
+        for setting_id, prerequisites in pending.items():
+            missing = prerequisites - unlocked
+            pending[setting_id] = missing
+            if not missing:
+                unlocked.add(setting_id)
+                queue.append(setting_id)
 
-            for setting_id, setting in self.game_state.settings.items():
-                if setting_id in unlocked:
+        while queue:
+            unlocked_id = queue.pop()
+            for dependent in dependents.get(unlocked_id, []):
+                if dependent in unlocked:
                     continue
-
-                if self._can_unlock_with(setting_id, unlocked):
-                    unlocked.add(setting_id)
-                    changed = True
+                missing = pending[dependent]
+                missing.discard(unlocked_id)
+                if not missing:
+                    unlocked.add(dependent)
+                    queue.append(dependent)
 
         return unlocked
 
-    def _can_unlock_with(self, setting_id: str, unlocked: set[str]) -> bool:
-        deps = self.game_state.resolver.dependencies.get(setting_id, [])
+    def _unlock_prerequisites(self, setting_id: str) -> set[str]:
+        prerequisites = set()
 
-        for dep in deps:
+        for dep in self.game_state.resolver.dependencies.get(setting_id, []):
             if isinstance(dep, SimpleDependency):
-                if dep.setting_id not in unlocked:
-                    if dep.required_state == SettingState.ENABLED:
-                        return False
+                if dep.required_state == SettingState.ENABLED:
+                    prerequisites.add(dep.setting_id)
             elif isinstance(dep, ValueDependency):
-                if dep.setting_a not in unlocked or dep.setting_b not in unlocked:
-                    return False
+                prerequisites.add(dep.setting_a)
+                prerequisites.add(dep.setting_b)
 
-        return True
+        return prerequisites
 
     def get_report(self) -> str:
         if not self.issues:
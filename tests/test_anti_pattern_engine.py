@@ -1,9 +1,14 @@
 
 import pytest
 
-from src.anti_patterns.effects import FakeErrorEffect, FreezeProgressEffect
+from src.anti_patterns.effects import (
+    Effect,
+    EffectContext,
+    FakeErrorEffect,
+    FreezeProgressEffect,
+)
 from src.anti_patterns.engine import AntiPatternEngine
-from src.anti_patterns.triggers import CounterTrigger, RandomTrigger
+from src.anti_patterns.triggers import CounterTrigger, ProgressTrigger, RandomTrigger
 from src.core.enums import SettingState, SettingType
 from src.core.game_state import GameState
 from src.core.menu import MenuNode
@@ -183,6 +188,28 @@ def test_multiple_patterns(engine, ui_state):
     assert len(ui_state.get("fake_messages", [])) == 2
 
 
+class EnableAllEffect(Effect):
+    def apply(self, context: EffectContext) -> None:
+        self.remaining = self.duration
+        for setting in context.game_state.settings.values():
+            setting.state = SettingState.ENABLED
+
+
+def test_progress_trigger_sees_effect_changes_in_same_check(engine):
+    engine.add_pattern(
+        "enable_all", ProgressTrigger("low", 0.0, 0.0), EnableAllEffect("enable")
+    )
+    engine.add_pattern(
+        "complete",
+        ProgressTrigger("high", 100.0, 100.0),
+        FakeErrorEffect("done", "Done"),
+    )
+
+    engine.update()
+
+    assert engine.get_active_effect_ids() == ["enable", "done"]
+
+
 def test_get_active_effect_ids(engine):
     trigger = CounterTrigger("test_trigger", "clicks", 1)
     effect = FreezeProgressEffect("test_effect", duration=5)
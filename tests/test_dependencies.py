@@ -202,3 +202,16 @@ def test_multiple_dependencies():
     # Disable B
     setting_b.state = SettingState.DISABLED
     assert resolver.can_enable("c", state) is False
+
+
+def test_add_dependencies_bulk():
+    """Test adding several dependencies in one call."""
+    resolver = DependencyResolver()
+    dep_a = SimpleDependency("a", SettingState.ENABLED)
+    dep_b = SimpleDependency("b", SettingState.ENABLED)
+    dep_c = SimpleDependency("c", SettingState.ENABLED)
+
+    resolver.add_dependencies([("x", dep_a), ("y", dep_b), ("x", dep_c)])
+
+    assert resolver.dependencies["x"] == [dep_a, dep_c]
+    assert resolver.dependencies["y"] == [dep_b]
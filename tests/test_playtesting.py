@@ -1,158 +1,152 @@
-import tempfile
 import time
-import unittest
-from pathlib import Path
+
+import pytest
 
 from src.testing.playtest_session import PlaytestTracker
 
 
-class TestPlaytestTracker(unittest.TestCase):
-    def test_initialization(self):
-        tracker = PlaytestTracker(seed=12345)
+@pytest.fixture
+def tracker():
+    return PlaytestTracker()
+
+
+def test_initialization():
+    tracker = PlaytestTracker(seed=12345)
+
+    assert tracker.metrics.seed == 12345
+    assert tracker.metrics.session_id is not None
+    assert tracker.metrics.end_time is None
+    assert not tracker.metrics.completed
+
+
+def test_record_setting_interaction(tracker):
+    tracker.record_setting_interaction("s1", "enable", True, True)
+
+    assert len(tracker.metrics.setting_interactions) == 1
+    interaction = tracker.metrics.setting_interactions[0]
+    assert interaction.setting_id == "s1"
+    assert interaction.action == "enable"
+    assert interaction.value is True
+    assert interaction.success
+
 
-        self.assertEqual(tracker.metrics.seed, 12345)
-        self.assertIsNotNone(tracker.metrics.session_id)
-        self.assertIsNone(tracker.metrics.end_time)
-        self.assertFalse(tracker.metrics.completed)
+def test_record_menu_visit(tracker):
+    tracker.record_menu_visit("menu1")
+    time.sleep(0.1)
+    tracker.record_menu_visit("menu2")
 
-    def test_record_setting_interaction(self):
-        tracker = PlaytestTracker()
-        tracker.record_setting_interaction("s1", "enable", True, True)
+    assert len(tracker.metrics.menu_visits) == 1
+    visit = tracker.metrics.menu_visits[0]
+    assert visit.menu_id == "menu1"
+    assert visit.duration > 0
 
-        self.assertEqual(len(tracker.metrics.setting_interactions), 1)
-        interaction = tracker.metrics.setting_interactions[0]
-        self.assertEqual(interaction.setting_id, "s1")
-        self.assertEqual(interaction.action, "enable")
-        self.assertEqual(interaction.value, True)
-        self.assertTrue(interaction.success)
 
-    def test_record_menu_visit(self):
-        tracker = PlaytestTracker()
+def test_record_error(tracker):
+    tracker.record_error("Test error message")
 
-        tracker.record_menu_visit("menu1")
-        time.sleep(0.1)
-        tracker.record_menu_visit("menu2")
+    assert len(tracker.metrics.errors) == 1
+    assert tracker.metrics.errors[0] == "Test error message"
 
-        self.assertEqual(len(tracker.metrics.menu_visits), 1)
-        visit = tracker.metrics.menu_visits[0]
-        self.assertEqual(visit.menu_id, "menu1")
-        self.assertGreater(visit.duration, 0)
 
-    def test_record_error(self):
-        tracker = PlaytestTracker()
-        tracker.record_error("Test error message")
+def test_complete_session(tracker):
+    tracker.record_menu_visit("menu1")
+    time.sleep(0.1)
+    tracker.complete_session(completed=True)
 
-        self.assertEqual(len(tracker.metrics.errors), 1)
-        self.assertEqual(tracker.metrics.errors[0], "Test error message")
+    assert tracker.metrics.end_time is not None
+    assert tracker.metrics.completed
+    assert tracker.metrics.duration > 0
 
-    def test_complete_session(self):
-        tracker = PlaytestTracker()
-        tracker.record_menu_visit("menu1")
-        time.sleep(0.1)
-        tracker.complete_session(completed=True)
 
-        self.assertIsNotNone(tracker.metrics.end_time)
-        self.assertTrue(tracker.metrics.completed)
-        self.assertGreater(tracker.metrics.duration, 0)
+def test_save_and_load(tmp_path):
+    tracker = PlaytestTracker(seed=42)
+    tracker.record_setting_interaction("s1", "enable", True, True)
+    tracker.record_menu_visit("menu1")
+    tracker.record_error("Test error")
 
-    def test_save_and_load(self):
-        tracker = PlaytestTracker(seed=42)
-        tracker.record_setting_interaction("s1", "enable", True, True)
-        tracker.record_menu_visit("menu1")
-        tracker.record_error("Test error")
+    filepath = tmp_path / "test_session.json"
+    tracker.save(filepath)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = Path(tmpdir) / "test_session.json"
-            tracker.save(filepath)
+    loaded = PlaytestTracker.load(filepath)
 
-            loaded = PlaytestTracker.load(filepath)
+    assert loaded.metrics.seed == tracker.metrics.seed
+    assert len(loaded.metrics.setting_interactions) == len(
+        tracker.metrics.setting_interactions
+    )
+    assert len(loaded.metrics.errors) == len(tracker.metrics.errors)
 
-            self.assertEqual(loaded.metrics.seed, tracker.metrics.seed)
-            self.assertEqual(
-                len(loaded.metrics.setting_interactions),
-                len(tracker.metrics.setting_interactions),
-            )
-            self.assertEqual(len(loaded.metrics.errors), len(tracker.metrics.errors))
 
-    def test_metrics_properties(self):
-        tracker = PlaytestTracker()
+def test_metrics_properties(tracker):
+    tracker.record_setting_interaction("s1", "enable", True, True)
+    tracker.record_setting_interaction("s2", "enable", True, False)
+    tracker.record_setting_interaction("s1", "update", 42, True)
 
-        tracker.record_setting_interaction("s1", "enable", True, True)
-        tracker.record_setting_interaction("s2", "enable", True, False)
-        tracker.record_setting_interaction("s1", "update", 42, True)
+    assert tracker.metrics.total_interactions == 3
+    assert tracker.metrics.failed_interactions == 1
+    assert tracker.metrics.unique_settings_touched == 2
 
-        self.assertEqual(tracker.metrics.total_interactions, 3)
-        self.assertEqual(tracker.metrics.failed_interactions, 1)
-        self.assertEqual(tracker.metrics.unique_settings_touched, 2)
 
-    def test_problem_settings_identification(self):
-        tracker = PlaytestTracker()
+def test_problem_settings_identification(tracker):
+    tracker.record_setting_interaction("s1", "enable", True, False)
+    tracker.record_setting_interaction("s1", "enable", True, False)
+    tracker.record_setting_interaction("s2", "enable", True, False)
 
-        tracker.record_setting_interaction("s1", "enable", True, False)
-        tracker.record_setting_interaction("s1", "enable", True, False)
-        tracker.record_setting_interaction("s2", "enable", True, False)
+    problems = tracker.metrics.get_problem_settings()
 
-        problems = tracker.metrics.get_problem_settings()
+    assert len(problems) == 2
+    assert problems[0][0] == "s1"
+    assert problems[0][1] == 2
 
-        self.assertEqual(len(problems), 2)
-        self.assertEqual(problems[0][0], "s1")
-        self.assertEqual(problems[0][1], 2)
 
-    def test_problem_menus_identification(self):
-        tracker = PlaytestTracker()
+def test_problem_menus_identification(tracker):
+    tracker.record_menu_visit("menu1")
+    time.sleep(0.15)
+    tracker.record_menu_visit("menu2")
+    time.sleep(0.05)
+    tracker.complete_session()
 
-        tracker.record_menu_visit("menu1")
-        time.sleep(0.15)
-        tracker.record_menu_visit("menu2")
-        time.sleep(0.05)
-        tracker.complete_session()
+    problems = tracker.metrics.get_problem_menus()
 
-        problems = tracker.metrics.get_problem_menus()
+    assert len(problems) == 2
+    assert problems[0][1] > problems[1][1]
 
-        self.assertEqual(len(problems), 2)
-        self.assertGreater(problems[0][1], problems[1][1])
 
-    def test_get_summary_format(self):
-        tracker = PlaytestTracker(seed=123)
-        tracker.record_setting_interaction("s1", "enable", True, True)
-        tracker.record_menu_visit("menu1")
-        tracker.complete_session(completed=True)
+def test_get_summary_format():
+    tracker = PlaytestTracker(seed=123)
+    tracker.record_setting_interaction("s1", "enable", True, True)
+    tracker.record_menu_visit("menu1")
+    tracker.complete_session(completed=True)
 
-        summary = tracker.get_summary()
+    summary = tracker.get_summary()
 
-        self.assertIn("Playtest Session Summary", summary)
-        self.assertIn("Session ID:", summary)
-        self.assertIn("Seed: 123", summary)
-        self.assertIn("Completed: True", summary)
+    assert "Playtest Session Summary" in summary
+    assert "Session ID:" in summary
+    assert "Seed: 123" in summary
+    assert "Completed: True" in summary
 
-    def test_stuck_detection(self):
-        tracker = PlaytestTracker()
-        tracker.STUCK_THRESHOLD = 0.1
 
-        time.sleep(0.15)
-        is_stuck = tracker.check_stuck()
+def test_stuck_detection(tracker):
+    tracker.STUCK_THRESHOLD = 0.1
 
-        self.assertTrue(is_stuck)
-        self.assertEqual(len(tracker.metrics.stuck_events), 1)
+    time.sleep(0.15)
+    is_stuck = tracker.check_stuck()
 
-    def test_stuck_metrics(self):
-        tracker = PlaytestTracker()
-        tracker.metrics.stuck_events.append({"timestamp": time.time(), "duration": 30.0})
-        tracker.metrics.stuck_events.append({"timestamp": time.time(), "duration": 45.0})
+    assert is_stuck
+    assert len(tracker.metrics.stuck_events) == 1
 
-        self.assertEqual(tracker.metrics.total_stuck_time, 75.0)
-        self.assertEqual(tracker.metrics.avg_stuck_time, 37.5)
 
-    def test_unique_menus_visited(self):
-        tracker = PlaytestTracker()
+def test_stuck_metrics(tracker):
+    tracker.metrics.stuck_events.append({"timestamp": time.time(), "duration": 30.0})
+    tracker.metrics.stuck_events.append({"timestamp": time.time(), "duration": 45.0})
 
-        tracker.record_menu_visit("menu1")
-        tracker.record_menu_visit("menu2")
-        tracker.record_menu_visit("menu1")
-        tracker.complete_session()
+    assert tracker.metrics.total_stuck_time == 75.0
+    assert tracker.metrics.avg_stuck_time == 37.5
 
-        self.assertEqual(tracker.metrics.unique_menus_visited, 2)
 
+def test_unique_menus_visited(tracker):
+    tracker.record_menu_visit("menu1")
+    tracker.record_menu_visit("menu2")
+    tracker.record_menu_visit("menu1")
+    tracker.complete_session()
 
-if __name__ == "__main__":
-    unittest.main()
+    assert tracker.metrics.unique_menus_visited == 2
@@ -9,6 +9,16 @@ from src.core.progress import ProgressCalculator
 from src.core.types import Setting
 
 
+def make_bool_setting(setting_id, state, label=None):
+    return Setting(
+        id=setting_id,
+        type=SettingType.BOOLEAN,
+        value=False,
+        state=state,
+        label=label or setting_id.upper(),
+    )
+
+
 @pytest.fixture
 def progress_state():
     state = GameState()
@@ -16,27 +26,9 @@ def progress_state():
     menu1 = MenuNode(id="menu1", category="Test1")
     menu2 = MenuNode(id="menu2", category="Test2")
 
-    setting1 = Setting(
-        id="s1",
-        type=SettingType.BOOLEAN,
-        value=False,
-        state=SettingState.ENABLED,
-        label="S1",
-    )
-    setting2 = Setting(
-        id="s2",
-        type=SettingType.BOOLEAN,
-        value=False,
-        state=SettingState.DISABLED,
-        label="S2",
-    )
-    setting3 = Setting(
-        id="s3",
-        type=SettingType.BOOLEAN,
-        value=False,
-        state=SettingState.LOCKED,
-        label="S3",
-    )
+    setting1 = make_bool_setting("s1", SettingState.ENABLED)
+    setting2 = make_bool_setting("s2", SettingState.DISABLED)
+    setting3 = make_bool_setting("s3", SettingState.LOCKED)
 
     menu1.add_setting(setting1)
     menu1.add_setting(setting2)
@@ -48,10 +40,13 @@ def progress_state():
     return state
 
 
-def test_progress_calculator_basic(progress_state):
+@pytest.fixture
+def calculator(progress_state):
     evaluator = DependencyEvaluator(progress_state)
-    calculator = ProgressCalculator(progress_state, evaluator)
+    return ProgressCalculator(progress_state, evaluator)
 
+
+def test_progress_calculator_basic(calculator):
     progress = calculator.calculate_overall_progress()
 
     assert progress >= 0.0
@@ -68,10 +63,7 @@ def test_progress_calculator_empty_state():
     assert progress == 0.0
 
 
-def test_progress_calculator_visited_bonus(progress_state):
-    evaluator = DependencyEvaluator(progress_state)
-    calculator = ProgressCalculator(progress_state, evaluator)
-
+def test_progress_calculator_visited_bonus(progress_state, calculator):
     progress_before = calculator.calculate_overall_progress()
 
     progress_state.visited_menus.append("menu1")
@@ -82,10 +74,7 @@ def test_progress_calculator_visited_bonus(progress_state):
     assert progress_after > progress_before
 
 
-def test_progress_menu_completion_incomplete(progress_state):
-    evaluator = DependencyEvaluator(progress_state)
-    calculator = ProgressCalculator(progress_state, evaluator)
-
+def test_progress_menu_completion_incomplete(progress_state, calculator):
     progress_state.get_setting("s1").state = SettingState.DISABLED
 
     completion = calculator.calculate_menu_completion("menu1")
@@ -93,10 +82,7 @@ def test_progress_menu_completion_incomplete(progress_state):
     assert completion == CompletionState.INCOMPLETE
 
 
-def test_progress_menu_completion_partial(progress_state):
-    evaluator = DependencyEvaluator(progress_state)
-    calculator = ProgressCalculator(progress_state, evaluator)
-
+def test_progress_menu_completion_partial(progress_state, calculator):
     progress_state.get_setting("s1").state = SettingState.ENABLED
 
     completion = calculator.calculate_menu_completion("menu1")
@@ -104,10 +90,7 @@ def test_progress_menu_completion_partial(progress_state):
     assert completion == CompletionState.PARTIAL
 
 
-def test_progress_menu_completion_complete(progress_state):
-    evaluator = DependencyEvaluator(progress_state)
-    calculator = ProgressCalculator(progress_state, evaluator)
-
+def test_progress_menu_completion_complete(progress_state, calculator):
     progress_state.get_setting("s1").state = SettingState.ENABLED
     progress_state.get_setting("s2").state = SettingState.ENABLED
 
@@ -116,19 +99,13 @@ def test_progress_menu_completion_complete(progress_state):
     assert completion == CompletionState.COMPLETE
 
 
-def test_progress_menu_completion_nonexistent(progress_state):
-    evaluator = DependencyEvaluator(progress_state)
-    calculator = ProgressCalculator(progress_state, evaluator)
-
+def test_progress_menu_completion_nonexistent(calculator):
     completion = calculator.calculate_menu_completion("nonexistent")
 
     assert completion == CompletionState.INCOMPLETE
 
 
-def test_progress_critical_path(progress_state):
-    evaluator = DependencyEvaluator(progress_state)
-    calculator = ProgressCalculator(progress_state, evaluator)
-
+def test_progress_critical_path(progress_state, calculator):
     progress_state.visited_menus.append("menu1")
 
     critical_progress = calculator.get_critical_path_progress()
@@ -136,10 +113,7 @@ def test_progress_critical_path(progress_state):
     assert critical_progress == 50.0
 
 
-def test_progress_victory_condition(progress_state):
-    evaluator = DependencyEvaluator(progress_state)
-    calculator = ProgressCalculator(progress_state, evaluator)
-
+def test_progress_victory_condition(progress_state, calculator):
     progress_state.resolver.add_dependency("s2", SimpleDependency("s1", SettingState.ENABLED))
 
     victory = calculator.is_victory_condition_met()
@@ -155,13 +129,7 @@ def test_progress_victory_condition(progress_state):
 def test_progress_victory_no_critical_settings():
     state = GameState()
 
-    setting = Setting(
-        id="s1",
-        type=SettingType.BOOLEAN,
-        value=False,
-        state=SettingState.ENABLED,
-        label="S1",
-    )
+    setting = make_bool_setting("s1", SettingState.ENABLED)
 
     menu = MenuNode(id="menu", category="Test")
     menu.add_setting(setting)
@@ -174,24 +142,17 @@ def test_progress_victory_no_critical_settings():
     assert victory is False
 
 
-def test_progress_count_configured_settings(progress_state):
-    evaluator = DependencyEvaluator(progress_state)
-    calculator = ProgressCalculator(progress_state, evaluator)
-
+def test_progress_count_configured_settings(calculator):
     count = calculator._count_configured_settings()
 
     assert count == 2
 
 
-def test_progress_capped_at_99(progress_state):
-    evaluator = DependencyEvaluator(progress_state)
-    calculator = ProgressCalculator(progress_state, evaluator)
-
+def test_progress_capped_at_99(progress_state, calculator):
     for setting in progress_state.settings.values():
         setting.state = SettingState.ENABLED
 
-    for i in range(100):
-        progress_state.visited_menus.append(f"menu{i}")
+    progress_state.visited_menus.extend(map("menu{}".format, range(100)))
 
     progress = calculator.calculate_overall_progress()
 
@@ -37,8 +37,7 @@ def test_reliable_progress_bar_max(config):
 def test_stuck_progress_bar_gets_stuck(config):
     bar = StuckProgressBar("Test", config, stuck_at=0.5)
 
-    while bar.progress < 0.5:
-        bar.update(0.1)
+    bar.progress = 0.5
 
     bar.update(0.1)
     assert bar.is_stuck is True
@@ -80,21 +79,15 @@ def test_progress_bar_render(config):
     assert "50%" in lines[0]
 
 
-def test_progress_bar_factory_create_reliable(config):
-    bar = ProgressBarFactory.create("Test", "reliable", config)
-    assert isinstance(bar, ReliableProgressBar)
-
-
-def test_progress_bar_factory_create_unreliable(config):
-    bar = ProgressBarFactory.create("Test", "unreliable", config)
-    assert isinstance(bar, UnreliableProgressBar)
-
-
-def test_progress_bar_factory_create_stuck(config):
-    bar = ProgressBarFactory.create("Test", "stuck", config)
-    assert isinstance(bar, StuckProgressBar)
-
-
-def test_progress_bar_factory_create_nested(config):
-    bar = ProgressBarFactory.create("Test", "nested", config)
-    assert isinstance(bar, NestedProgressBar)
+@pytest.mark.parametrize(
+    "bar_type,expected_class",
+    [
+        ("reliable", ReliableProgressBar),
+        ("unreliable", UnreliableProgressBar),
+        ("stuck", StuckProgressBar),
+        ("nested", NestedProgressBar),
+    ],
+)
+def test_progress_bar_factory_create(config, bar_type, expected_class):
+    bar = ProgressBarFactory.create("Test", bar_type, config)
+    assert isinstance(bar, expected_class)
@@ -1,5 +1,3 @@
-import tempfile
-
 import pytest
 
 from src.core.enums import SettingState, SettingType
@@ -10,24 +8,22 @@ from src.core.propagation import PropagationRule, StatePropagator
 from src.core.types import Setting
 
 
+def make_bool_setting(setting_id, state, label=None):
+    return Setting(
+        id=setting_id,
+        type=SettingType.BOOLEAN,
+        value=False,
+        state=state,
+        label=label or setting_id.upper(),
+    )
+
+
 @pytest.fixture
 def propagation_state():
     state = GameState()
 
-    setting_a = Setting(
-        id="a",
-        type=SettingType.BOOLEAN,
-        value=False,
-        state=SettingState.DISABLED,
-        label="A",
-    )
-    setting_b = Setting(
-        id="b",
-        type=SettingType.BOOLEAN,
-        value=False,
-        state=SettingState.DISABLED,
-        label="B",
-    )
+    setting_a = make_bool_setting("a", SettingState.DISABLED)
+    setting_b = make_bool_setting("b", SettingState.DISABLED)
     setting_c = Setting(
         id="c",
         type=SettingType.INTEGER,
@@ -47,6 +43,20 @@ def propagation_state():
     return state
 
 
+@pytest.fixture(scope="session")
+def propagation_ini(tmp_path_factory):
+    config_path = tmp_path_factory.mktemp("propagation") / "rules.ini"
+    config_path.write_text(
+        """[test_rule]
+trigger_setting = a
+condition = state == enabled
+affected = b
+effect = state = enabled
+"""
+    )
+    return str(config_path)
+
+
 def test_propagator_basic(propagation_state):
     evaluator = DependencyEvaluator(propagation_state)
     propagator = StatePropagator(propagation_state, evaluator)
@@ -135,13 +145,7 @@ def test_propagator_parse_condition():
     propagator = StatePropagator(state, evaluator)
 
     cond_eq = propagator._parse_condition("state == enabled")
-    setting = Setting(
-        id="test",
-        type=SettingType.BOOLEAN,
-        value=False,
-        state=SettingState.ENABLED,
-        label="Test",
-    )
+    setting = make_bool_setting("test", SettingState.ENABLED, "Test")
     assert cond_eq(setting) is True
 
     cond_gt = propagator._parse_condition("value > 50")
@@ -169,22 +173,11 @@ def test_propagator_parse_effect():
     assert setting.value == 100
 
 
-def test_propagator_config_loading(propagation_state):
+def test_propagator_config_loading(propagation_state, propagation_ini):
     evaluator = DependencyEvaluator(propagation_state)
     propagator = StatePropagator(propagation_state, evaluator)
 
-    config_content = """[test_rule]
-trigger_setting = a
-condition = state == enabled
-affected = b
-effect = state = enabled
-"""
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ini", delete=False) as f:
-        f.write(config_content)
-        config_path = f.name
-
-    propagator.load_rules_from_config(config_path)
+    propagator.load_rules_from_config(propagation_ini)
 
     assert len(propagator.rules) == 1
     assert propagator.rules[0].trigger_setting == "a"
@@ -1,83 +1,61 @@
-from pathlib import Path
-import tempfile
 import json
-from time import sleep
-from src.meta.self_awareness import SelfAwarenessSystem
-
-
-def test_self_awareness_initialization():
-    system = SelfAwarenessSystem()
-    assert len(system.comments) == 0
-    assert system.awareness_level == 0
-    assert len(system.triggered_comments) == 0
-
-
-def test_self_awareness_load_comments():
-    system = SelfAwarenessSystem()
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "comments.json"
-        data = {
-            "comments": [
-                {
-                    "id": "test1",
-                    "trigger": "time_spent_excessive",
-                    "min_awareness": 0,
-                    "show_once": True,
-                    "text": "Test comment",
-                }
-            ]
-        }
-
-        with open(filepath, "w") as f:
-            json.dump(data, f)
-
-        system.load_comments(filepath)
-        assert len(system.comments) == 1
-
-
-def test_self_awareness_trigger_checks():
-    system = SelfAwarenessSystem()
-
-    context_excessive_time = {"time_spent": 700}
-    assert system._check_trigger("time_spent_excessive", context_excessive_time) is True
+from unittest.mock import patch
 
-    context_normal_time = {"time_spent": 100}
-    assert system._check_trigger("time_spent_excessive", context_normal_time) is False
+import pytest
 
+from src.meta.self_awareness import SelfAwarenessSystem
 
-def test_self_awareness_failed_attempts_trigger():
-    system = SelfAwarenessSystem()
-
-    context_many_fails = {"failed_attempts": 15}
-    assert system._check_trigger("many_failed_attempts", context_many_fails) is True
 
-    context_few_fails = {"failed_attempts": 5}
-    assert system._check_trigger("many_failed_attempts", context_few_fails) is False
+@pytest.fixture
+def system():
+    return SelfAwarenessSystem()
 
 
-def test_self_awareness_glitch_trigger():
-    system = SelfAwarenessSystem()
+def test_self_awareness_initialization(system):
+    assert len(system.comments) == 0
+    assert system.awareness_level == 0
+    assert len(system.triggered_comments) == 0
 
-    context_with_glitch = {"glitch_count": 3}
-    assert system._check_trigger("glitch_occurred", context_with_glitch) is True
 
-    context_no_glitch = {"glitch_count": 0}
-    assert system._check_trigger("glitch_occurred", context_no_glitch) is False
+def test_self_awareness_load_comments(system, tmp_path):
+    filepath = tmp_path / "comments.json"
+    data = {
+        "comments": [
+            {
+                "id": "test1",
+                "trigger": "time_spent_excessive",
+                "min_awareness": 0,
+                "show_once": True,
+                "text": "Test comment",
+            }
+        ]
+    }
 
+    with open(filepath, "w") as f:
+        json.dump(data, f)
 
-def test_self_awareness_layer_depth_trigger():
-    system = SelfAwarenessSystem()
+    system.load_comments(filepath)
+    assert len(system.comments) == 1
 
-    context_deep = {"layer_depth": 7}
-    assert system._check_trigger("deep_layer_reached", context_deep) is True
 
-    context_shallow = {"layer_depth": 2}
-    assert system._check_trigger("deep_layer_reached", context_shallow) is False
+@pytest.mark.parametrize(
+    "trigger,context,expected",
+    [
+        ("time_spent_excessive", {"time_spent": 700}, True),
+        ("time_spent_excessive", {"time_spent": 100}, False),
+        ("many_failed_attempts", {"failed_attempts": 15}, True),
+        ("many_failed_attempts", {"failed_attempts": 5}, False),
+        ("glitch_occurred", {"glitch_count": 3}, True),
+        ("glitch_occurred", {"glitch_count": 0}, False),
+        ("deep_layer_reached", {"layer_depth": 7}, True),
+        ("deep_layer_reached", {"layer_depth": 2}, False),
+    ],
+)
+def test_self_awareness_trigger_checks(system, trigger, context, expected):
+    assert system._check_trigger(trigger, context) is expected
 
 
-def test_self_awareness_awareness_level():
-    system = SelfAwarenessSystem()
+def test_self_awareness_awareness_level(system):
     assert system.get_awareness_level() == 0
 
     system.increase_awareness(3)
@@ -87,9 +65,7 @@ def test_self_awareness_awareness_level():
     assert system.get_awareness_level() == 10
 
 
-def test_self_awareness_comment_eligibility():
-    system = SelfAwarenessSystem()
-
+def test_self_awareness_comment_eligibility(system):
     comment = {
         "id": "test",
         "trigger": "time_spent_excessive",
@@ -108,9 +84,7 @@ def test_self_awareness_comment_eligibility():
     assert system._is_comment_eligible(comment, context) is True
 
 
-def test_self_awareness_show_once():
-    system = SelfAwarenessSystem()
-
+def test_self_awareness_show_once(system):
     comment = {
         "id": "test",
         "trigger": "time_spent_excessive",
@@ -125,9 +99,7 @@ def test_self_awareness_show_once():
     assert system._is_comment_eligible(comment, context) is False
 
 
-def test_self_awareness_get_contextual_comment():
-    system = SelfAwarenessSystem()
-
+def test_self_awareness_get_contextual_comment(system):
     comment = {
         "id": "test",
         "trigger": "time_spent_excessive",
@@ -144,9 +116,7 @@ def test_self_awareness_get_contextual_comment():
     assert "test" in system.triggered_comments
 
 
-def test_self_awareness_no_eligible_comments():
-    system = SelfAwarenessSystem()
-
+def test_self_awareness_no_eligible_comments(system):
     comment = {
         "id": "test",
         "trigger": "time_spent_excessive",
@@ -162,30 +132,21 @@ def test_self_awareness_no_eligible_comments():
     assert result is None
 
 
-def test_self_awareness_cooldown():
-    system = SelfAwarenessSystem()
+def test_self_awareness_cooldown(system):
     system.comment_cooldown = 0.1
+    system.last_comment_time = 100.0
 
     context = {"time_spent": 700}
 
-    assert system.should_trigger_comment(context) is False
-
-    sleep(0.15)
-    system.last_comment_time = 0.0
-
-    system.awareness_level = 10
-    triggered = False
-    for _ in range(100):
-        if system.should_trigger_comment(context):
-            triggered = True
-            break
-
-    assert triggered
+    with patch("src.meta.self_awareness.random", return_value=0.0):
+        with patch("src.meta.self_awareness.time", return_value=100.05):
+            assert system.should_trigger_comment(context) is False
 
+        with patch("src.meta.self_awareness.time", return_value=100.15):
+            assert system.should_trigger_comment(context) is True
 
-def test_self_awareness_multiple_triggers():
-    system = SelfAwarenessSystem()
 
+def test_self_awareness_multiple_triggers(system):
     comments = [
         {
             "id": "time",
@@ -171,6 +171,29 @@ def test_session_event_limit(session_state):
     assert len(data["events"]) == 100
 
 
+def test_session_record_events_batch(session_state):
+    manager = SessionManager(session_state)
+
+    manager.record_events(
+        [("setting_viewed", None), ("click", {"button": "left"}), ("unknown", None)]
+    )
+
+    assert len(manager.events) == 3
+    assert manager.events[1]["data"]["button"] == "left"
+    assert manager.metrics.settings_viewed == 1
+    assert manager.metrics.clicks == 1
+
+
+def test_session_record_events_limit(session_state):
+    manager = SessionManager(session_state)
+
+    manager.record_events(("click", {"count": i}) for i in range(150))
+
+    assert len(manager.events) == 100
+    assert manager.events[0]["data"]["count"] == 50
+    assert manager.metrics.clicks == 150
+
+
 def test_session_unknown_event_type(session_state):
     manager = SessionManager(session_state)
 
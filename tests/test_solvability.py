@@ -1,4 +1,4 @@
-import unittest
+import pytest
 
 from src.core.dependencies import SimpleDependency
 from src.core.enums import SettingState, SettingType
@@ -8,231 +8,187 @@ from src.core.types import Setting
 from src.testing.solvability_checker import SolvabilityChecker
 
 
-class TestSolvabilityChecker(unittest.TestCase):
-    def setUp(self):
-        self.game_state = GameState()
-
-    def test_empty_game_is_solvable(self):
-        checker = SolvabilityChecker(self.game_state)
-        self.assertTrue(checker.validate())
-        self.assertEqual(len(checker.issues), 0)
-
-    def test_simple_solvable_game(self):
-        menu = MenuNode(id="menu1", category="test")
-        setting1 = Setting(
-            id="s1",
-            type=SettingType.BOOLEAN,
-            value=True,
-            state=SettingState.ENABLED,
-            label="Setting 1",
-        )
-        setting2 = Setting(
-            id="s2",
-            type=SettingType.BOOLEAN,
-            value=False,
-            state=SettingState.LOCKED,
-            label="Setting 2",
-        )
-        menu.add_setting(setting1)
-        menu.add_setting(setting2)
-        self.game_state.add_menu(menu)
-        self.game_state.current_menu = "menu1"
-
-        self.game_state.resolver.add_dependency(
-            "s2", SimpleDependency("s1", SettingState.ENABLED)
-        )
-
-        checker = SolvabilityChecker(self.game_state)
-        self.assertTrue(checker.validate())
-
-    def test_circular_dependency_detected(self):
-        menu = MenuNode(id="menu1", category="test")
-        setting1 = Setting(
-            id="s1",
-            type=SettingType.BOOLEAN,
-            value=False,
-            state=SettingState.LOCKED,
-            label="Setting 1",
-        )
-        setting2 = Setting(
-            id="s2",
-            type=SettingType.BOOLEAN,
-            value=False,
-            state=SettingState.LOCKED,
-            label="Setting 2",
-        )
-        menu.add_setting(setting1)
-        menu.add_setting(setting2)
-        self.game_state.add_menu(menu)
-
-        self.game_state.resolver.add_dependency(
-            "s1", SimpleDependency("s2", SettingState.ENABLED)
-        )
-        self.game_state.resolver.add_dependency(
-            "s2", SimpleDependency("s1", SettingState.ENABLED)
-        )
-
-        checker = SolvabilityChecker(self.game_state)
-        self.assertFalse(checker.validate())
-        self.assertTrue(
-            any(issue.type == "circular_dependency" for issue in checker.issues)
-        )
-
-    def test_missing_dependency_detected(self):
-        menu = MenuNode(id="menu1", category="test")
-        setting1 = Setting(
-            id="s1",
-            type=SettingType.BOOLEAN,
-            value=False,
-            state=SettingState.LOCKED,
-            label="Setting 1",
-        )
-        menu.add_setting(setting1)
-        self.game_state.add_menu(menu)
-
-        self.game_state.resolver.add_dependency(
-            "s1", SimpleDependency("nonexistent", SettingState.ENABLED)
-        )
-
-        checker = SolvabilityChecker(self.game_state)
-        self.assertFalse(checker.validate())
-        self.assertTrue(
-            any(issue.type == "missing_dependency" for issue in checker.issues)
-        )
-
-    def test_unreachable_menu_detected(self):
-        menu1 = MenuNode(id="menu1", category="test", connections=["menu2"])
-        menu2 = MenuNode(id="menu2", category="test")
-        menu3 = MenuNode(id="menu3", category="test")
-
-        self.game_state.add_menu(menu1)
-        self.game_state.add_menu(menu2)
-        self.game_state.add_menu(menu3)
-        self.game_state.current_menu = "menu1"
-
-        checker = SolvabilityChecker(self.game_state)
-        self.assertFalse(checker.validate())
-        self.assertTrue(
-            any(issue.type == "unreachable_menus" for issue in checker.issues)
-        )
-
-    def test_unlockable_setting_detected(self):
-        menu = MenuNode(id="menu1", category="test")
-        setting1 = Setting(
-            id="s1",
-            type=SettingType.BOOLEAN,
-            value=False,
-            state=SettingState.LOCKED,
-            label="Setting 1",
-        )
-        setting2 = Setting(
-            id="s2",
-            type=SettingType.BOOLEAN,
-            value=False,
-            state=SettingState.LOCKED,
-            label="Setting 2",
-        )
-        menu.add_setting(setting1)
-        menu.add_setting(setting2)
-        self.game_state.add_menu(menu)
-
-        self.game_state.resolver.add_dependency(
-            "s1", SimpleDependency("s2", SettingState.ENABLED)
-        )
-        self.game_state.resolver.add_dependency(
-            "s2", SimpleDependency("s1", SettingState.ENABLED)
-        )
-
-        checker = SolvabilityChecker(self.game_state)
-        self.assertFalse(checker.validate())
-        self.assertTrue(
-            any(issue.type == "unlockable_setting" for issue in checker.issues)
-        )
-
-    def test_get_report_no_issues(self):
-        menu = MenuNode(id="menu1", category="test")
-        setting = Setting(
-            id="s1",
-            type=SettingType.BOOLEAN,
-            value=True,
-            state=SettingState.ENABLED,
-            label="Setting 1",
-        )
-        menu.add_setting(setting)
-        self.game_state.add_menu(menu)
-        self.game_state.current_menu = "menu1"
-
-        checker = SolvabilityChecker(self.game_state)
-        checker.validate()
-        report = checker.get_report()
-
-        self.assertIn("solvable", report)
-        self.assertIn("no issues", report)
-
-    def test_get_report_with_issues(self):
-        menu = MenuNode(id="menu1", category="test")
-        setting = Setting(
-            id="s1",
-            type=SettingType.BOOLEAN,
-            value=False,
-            state=SettingState.LOCKED,
-            label="Setting 1",
-        )
-        menu.add_setting(setting)
-        self.game_state.add_menu(menu)
-
-        self.game_state.resolver.add_dependency(
-            "s1", SimpleDependency("nonexistent", SettingState.ENABLED)
-        )
-
-        checker = SolvabilityChecker(self.game_state)
-        checker.validate()
-        report = checker.get_report()
-
-        self.assertIn("issues", report)
-        self.assertIn("Critical", report)
-
-    def test_complex_dependency_chain(self):
-        menu = MenuNode(id="menu1", category="test")
-
-        s1 = Setting(
-            id="s1",
-            type=SettingType.BOOLEAN,
-            value=True,
-            state=SettingState.ENABLED,
-            label="S1",
-        )
-        s2 = Setting(
-            id="s2",
-            type=SettingType.BOOLEAN,
-            value=False,
-            state=SettingState.LOCKED,
-            label="S2",
-        )
-        s3 = Setting(
-            id="s3",
-            type=SettingType.BOOLEAN,
-            value=False,
-            state=SettingState.LOCKED,
-            label="S3",
-        )
-
-        menu.add_setting(s1)
-        menu.add_setting(s2)
-        menu.add_setting(s3)
-        self.game_state.add_menu(menu)
-        self.game_state.current_menu = "menu1"
-
-        self.game_state.resolver.add_dependency(
-            "s2", SimpleDependency("s1", SettingState.ENABLED)
-        )
-        self.game_state.resolver.add_dependency(
-            "s3", SimpleDependency("s2", SettingState.ENABLED)
-        )
-
-        checker = SolvabilityChecker(self.game_state)
-        self.assertTrue(checker.validate())
-
-
-if __name__ == "__main__":
-    unittest.main()
+def make_setting(setting_id, state, label):
+    return Setting(
+        id=setting_id,
+        type=SettingType.BOOLEAN,
+        value=state == SettingState.ENABLED,
+        state=state,
+        label=label,
+    )
+
+
+@pytest.fixture
+def empty_state():
+    return GameState()
+
+
+@pytest.fixture
+def locked_pair_state():
+    state = GameState()
+    menu = MenuNode(id="menu1", category="test")
+    menu.add_setting(make_setting("s1", SettingState.LOCKED, "Setting 1"))
+    menu.add_setting(make_setting("s2", SettingState.LOCKED, "Setting 2"))
+    state.add_menu(menu)
+    return state
+
+
+def add_circular_dependency(state):
+    state.resolver.add_dependency("s1", SimpleDependency("s2", SettingState.ENABLED))
+    state.resolver.add_dependency("s2", SimpleDependency("s1", SettingState.ENABLED))
+
+
+def test_empty_game_is_solvable(empty_state):
+    checker = SolvabilityChecker(empty_state)
+    assert checker.validate()
+    assert len(checker.issues) == 0
+
+
+def test_simple_solvable_game(empty_state):
+    menu = MenuNode(id="menu1", category="test")
+    menu.add_setting(make_setting("s1", SettingState.ENABLED, "Setting 1"))
+    menu.add_setting(make_setting("s2", SettingState.LOCKED, "Setting 2"))
+    empty_state.add_menu(menu)
+    empty_state.current_menu = "menu1"
+
+    empty_state.resolver.add_dependency(
+        "s2", SimpleDependency("s1", SettingState.ENABLED)
+    )
+
+    checker = SolvabilityChecker(empty_state)
+    assert checker.validate()
+
+
+def test_circular_dependency_detected(locked_pair_state):
+    add_circular_dependency(locked_pair_state)
+
+    checker = SolvabilityChecker(locked_pair_state)
+    assert not checker.validate()
+    assert checker.has_issue("circular_dependency")
+
+
+def test_missing_dependency_detected(empty_state):
+    menu = MenuNode(id="menu1", category="test")
+    menu.add_setting(make_setting("s1", SettingState.LOCKED, "Setting 1"))
+    empty_state.add_menu(menu)
+
+    empty_state.resolver.add_dependency(
+        "s1", SimpleDependency("nonexistent", SettingState.ENABLED)
+    )
+
+    checker = SolvabilityChecker(empty_state)
+    assert not checker.validate()
+    assert checker.has_issue("missing_dependency")
+
+
+def test_unreachable_menu_detected(empty_state):
+    empty_state.add_menu(MenuNode(id="menu1", category="test", connections=["menu2"]))
+    empty_state.add_menu(MenuNode(id="menu2", category="test"))
+    empty_state.add_menu(MenuNode(id="menu3", category="test"))
+    empty_state.current_menu = "menu1"
+
+    checker = SolvabilityChecker(empty_state)
+    assert not checker.validate()
+    assert checker.has_issue("unreachable_menus")
+
+
+def test_unknown_start_menu_reports_all_menus_unreachable(empty_state):
+    empty_state.add_menu(MenuNode(id="menu1", category="test", connections=["menu2"]))
+    empty_state.add_menu(MenuNode(id="menu2", category="test"))
+    empty_state.current_menu = "nowhere"
+
+    checker = SolvabilityChecker(empty_state)
+    assert not checker.validate()
+    assert checker.has_issue("unreachable_menus")
+
+    issue = next(i for i in checker.issues if i.type == "unreachable_menus")
+    assert issue.affected_items == ["menu1", "menu2"]
+
+
+def test_dangling_connection_target_reported_unreachable(empty_state):
+    empty_state.add_menu(MenuNode(id="menu1", category="test"))
+    empty_state.add_menu(MenuNode(id="menu2", category="test", connections=["ghost"]))
+    empty_state.current_menu = "menu1"
+
+    checker = SolvabilityChecker(empty_state)
+    assert not checker.validate()
+    assert checker.has_issue("unreachable_menus")
+
+    issue = next(i for i in checker.issues if i.type == "unreachable_menus")
+    assert issue.affected_items == ["ghost", "menu2"]
+
+
+def test_unlockable_setting_detected(locked_pair_state):
+    add_circular_dependency(locked_pair_state)
+
+    checker = SolvabilityChecker(locked_pair_state)
+    assert not checker.validate()
+    assert checker.has_issue("unlockable_setting")
+
+
+def test_get_report_no_issues(empty_state):
+    menu = MenuNode(id="menu1", category="test")
+    menu.add_setting(make_setting("s1", SettingState.ENABLED, "Setting 1"))
+    empty_state.add_menu(menu)
+    empty_state.current_menu = "menu1"
+
+    checker = SolvabilityChecker(empty_state)
+    checker.validate()
+    report = checker.get_report()
+
+    assert "solvable" in report
+    assert "no issues" in report
+
+
+def test_get_report_with_issues(empty_state):
+    menu = MenuNode(id="menu1", category="test")
+    menu.add_setting(make_setting("s1", SettingState.LOCKED, "Setting 1"))
+    empty_state.add_menu(menu)
+
+    empty_state.resolver.add_dependency(
+        "s1", SimpleDependency("nonexistent", SettingState.ENABLED)
+    )
+
+    checker = SolvabilityChecker(empty_state)
+    checker.validate()
+    report = checker.get_report()
+
+    assert "issues" in report
+    assert "Critical" in report
+
+
+def test_complex_dependency_chain(empty_state):
+    menu = MenuNode(id="menu1", category="test")
+    menu.add_setting(make_setting("s1", SettingState.ENABLED, "S1"))
+    menu.add_setting(make_setting("s2", SettingState.LOCKED, "S2"))
+    menu.add_setting(make_setting("s3", SettingState.LOCKED, "S3"))
+    empty_state.add_menu(menu)
+    empty_state.current_menu = "menu1"
+
+    empty_state.resolver.add_dependency(
+        "s2", SimpleDependency("s1", SettingState.ENABLED)
+    )
+    empty_state.resolver.add_dependency(
+        "s3", SimpleDependency("s2", SettingState.ENABLED)
+    )
+
+    checker = SolvabilityChecker(empty_state)
+    assert checker.validate()
+
+
+def test_invalidate_picks_up_new_dependencies(locked_pair_state):
+    locked_pair_state.current_menu = "menu1"
+    locked_pair_state.resolver.add_dependency(
+        "s1", SimpleDependency("s2", SettingState.ENABLED)
+    )
+
+    checker = SolvabilityChecker(locked_pair_state)
+    checker.validate()
+    assert not checker.has_issue("circular_dependency")
+
+    locked_pair_state.resolver.add_dependency(
+        "s2", SimpleDependency("s1", SettingState.ENABLED)
+    )
+    checker.invalidate()
+    checker.validate()
+    assert checker.has_issue("circular_dependency")
@@ -59,6 +59,16 @@ def test_statistics_tracker_efficiency_tracking():
     assert tracker.stats.average_efficiency == 85.0
 
 
+def test_statistics_tracker_efficiency_repeated_layer():
+    tracker = StatisticsTracker()
+
+    tracker.record_layer_completion("layer1", {"efficiency": 60.0})
+    tracker.record_layer_completion("layer1", {"efficiency": 90.0})
+
+    assert tracker.stats.layers_completed == 2
+    assert tracker.stats.average_efficiency == 75.0
+
+
 def test_statistics_tracker_secret_recording():
     tracker = StatisticsTracker()
 
@@ -101,6 +111,13 @@ def test_statistics_save_and_load():
         assert "secret1" in new_tracker.stats.secrets_found
 
 
+def test_game_statistics_from_dict_ignores_unknown_keys():
+    stats = GameStatistics.from_dict({"total_actions": 7, "not_a_field": 1})
+
+    assert stats.total_actions == 7
+    assert stats.session_start_time > 0
+
+
 def test_game_statistics_get_summary():
     stats = GameStatistics()
     stats.total_actions = 100
@@ -71,6 +71,19 @@ class TestTopologyConverter:
         path = converter.get_critical_path()
         assert len(path) >= 1
 
+    def test_get_critical_path_cached_until_prune(self, config):
+        converter = TopologyConverter(config)
+        nx.add_path(converter.graph, ["A", "B", "C", "D"])
+        converter.graph.add_edges_from(("E", leaf) for leaf in "FGHI")
+
+        path = converter.get_critical_path()
+        assert path == ["A", "B", "C", "D"]
+        assert converter.get_critical_path() is path
+
+        converter.prune_dead_ends()
+
+        assert converter.get_critical_path()[0] == "E"
+
     def test_prune_dead_ends(self, config):
         converter = TopologyConverter(config)
         converter.graph.add_node("A")
@@ -93,6 +93,12 @@ def test_random_trigger_probability_clamping():
     assert trigger.probability == 0.0
 
 
+def test_random_trigger_probability_integer_config():
+    trigger = RandomTrigger("test", 1)
+    assert isinstance(trigger.probability, float)
+    assert trigger.probability == 1.0
+
+
 def test_event_trigger_event_not_present(context):
     trigger = EventTrigger("test", "test_event")
 
@@ -141,6 +147,21 @@ def test_progress_trigger_empty_state(context):
     assert not trigger.should_activate(empty_context)
 
 
+def test_progress_shared_within_check(context, game_state):
+    trigger = ProgressTrigger("test", 50.0, 75.0)
+
+    context.begin_check()
+    assert not trigger.should_activate(context)
+
+    for i in range(6):
+        game_state.get_setting(f"test_setting_{i}").state = SettingState.ENABLED
+
+    assert not trigger.should_activate(context)
+
+    context.end_check()
+    assert trigger.should_activate(context)
+
+
 def test_interval_trigger_first_activation(context):
     trigger = IntervalTrigger("test", "ticks", 10)
     context.counters["ticks"] = 10
@@ -197,6 +218,41 @@ def test_composite_trigger_any_required(context):
     assert composite.should_activate(context)
 
 
+def test_composite_trigger_checks_cheap_children_first(context):
+    progress = ProgressTrigger("progress", 0.0, 100.0)
+    counter = CounterTrigger("counter", "clicks", 5)
+
+    composite = CompositeTrigger("test", [progress, counter], require_all=True)
+
+    assert composite.triggers == [counter, progress]
+    assert composite.cost == progress.cost + counter.cost
+
+    context.counters["clicks"] = 0
+    assert not composite.should_activate(context)
+
+
+def test_composite_trigger_keeps_stateful_children_in_place(context):
+    progress = ProgressTrigger("progress", 50.0, 100.0)
+    once = OnceTrigger("once", CounterTrigger("counter", "clicks", 5))
+    interval = IntervalTrigger("interval", "ticks", 10)
+
+    composite = CompositeTrigger("test", [progress, once, interval], require_all=True)
+
+    assert composite.triggers == [progress, once, interval]
+    assert not composite.stateless
+
+    context.counters["clicks"] = 10
+    context.counters["ticks"] = 10
+    assert not composite.should_activate(context)
+    assert not once.has_fired
+    assert interval.last_activation == -10
+
+
+def test_once_trigger_reports_base_cost():
+    base = ProgressTrigger("base", 0.0, 100.0)
+    assert OnceTrigger("once", base).cost == base.cost
+
+
 def test_once_trigger_fires_once(context):
     base = CounterTrigger("base", "clicks", 5)
     once = OnceTrigger("test", base)
@@ -212,3 +212,29 @@ next_layer = final_level
     detector.load_from_config(config_path)
 
     assert len(detector.conditions) == 2
+
+
+def test_victory_check_computes_shared_progress_once(victory_state):
+    evaluator = DependencyEvaluator(victory_state)
+    progress = ProgressCalculator(victory_state, evaluator)
+    detector = VictoryDetector(victory_state, progress)
+
+    calls = []
+    progress.calculate_overall_progress = lambda: calls.append(1) or 0.0
+
+    detector.add_condition(
+        VictoryCondition(
+            VictoryType.COMPLETE, [detector._parse_requirement("progress > 90")]
+        )
+    )
+    detector.add_condition(
+        VictoryCondition(
+            VictoryType.PARTIAL, [detector._parse_requirement("progress > 50")]
+        )
+    )
+
+    assert detector.check_victory() is None
+    assert len(calls) == 1
+
+    detector.check_victory()
+    assert len(calls) == 2
@@ -53,6 +53,13 @@ class TestWFCGrid:
         neighbors = grid.get_neighbors((0, 0))
         assert len(neighbors) == 2
 
+    def test_get_neighbors_sees_replaced_cell(self):
+        grid = WFCGrid(width=3, height=3)
+        replacement = WFCCell(position=(1, 2), possible_states={"A"})
+        grid.cells[(1, 2)] = replacement
+
+        assert replacement in grid.get_neighbors((1, 1))
+
     def test_get_lowest_entropy_cell(self):
         grid = WFCGrid(width=2, height=2)
         for cell in grid.cells.values():
@@ -81,6 +88,21 @@ class TestWFCGrid:
         grid.cells[(0, 0)].collapsed = False
         assert grid.has_contradiction()
 
+    def test_scan_matches_individual_checks(self):
+        grid = WFCGrid(width=2, height=2)
+        for cell in grid.cells.values():
+            cell.entropy = 3
+        grid.cells[(0, 1)].entropy = 2
+        grid.cells[(1, 0)].entropy = 0
+        grid.cells[(1, 1)].collapsed = True
+
+        lowest, complete, contradiction = grid.scan()
+
+        assert lowest is grid.get_lowest_entropy_cell()
+        assert lowest.position == (0, 1)
+        assert not complete and not grid.is_complete()
+        assert contradiction and grid.has_contradiction()
+
 
 class TestWFCGenerator:
     @pytest.fixture